@@ -1,13 +1,31 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 import random
 import time
+import csv
+import os
+import json
+import heapq
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 # Constants
 MAX_QUESTIONS = 10
 MAX_SCORE = 100
 POINTS_FIRST_ATTEMPT = 10
 POINTS_SECOND_ATTEMPT = 5
+TIMER_INTERVAL_MS = 200
+
+# Leaderboard files
+RESULTS_FILE = "quizResults.csv"
+LEADERBOARD_FILE = "quizLeaderboard.json"
+LOCK_FILE = "quizResults.lock"
+LEADERBOARD_SIZE = 5
 
 # Global Game State 
 class QuizState:
@@ -22,6 +40,10 @@ class QuizState:
         self.time_taken = 0
         self.current_streak = 0
         self.max_streak = 0
+        self.attempt_start = 0
+        self.timer_job = None
+        # (question, attempt, seconds, correct) for every submitted answer
+        self.response_times = []
 
 quiz_state = QuizState()
 
@@ -66,6 +88,195 @@ def isCorrect(user_answer, correct_answer):
         # user input is not a valid number
         return False
 
+def latency_stats(seconds):
+    """
+    Summarises a list of response times.
+
+    :param seconds: A list of response times in seconds.
+    :return: A dict with mean, p50, p95 and slowest, or None if the list is empty.
+    """
+    if not seconds:
+        return None
+    ordered = sorted(seconds)
+
+    def percentile(p):
+        # nearest-rank percentile
+        rank = max(1, -(-len(ordered) * p // 100))
+        return ordered[int(rank) - 1]
+
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "p50": percentile(50),
+        "p95": percentile(95),
+        "slowest": ordered[-1],
+    }
+
+def export_latency_log(path, response_times):
+    """
+    Writes the per-attempt response times of a session to a CSV file.
+
+    :param path: The file to write.
+    :param response_times: A list of (question, attempt, seconds, correct) tuples.
+    """
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["question", "attempt", "seconds", "correct"])
+        for question, attempt, seconds, correct in response_times:
+            writer.writerow([question, attempt, f"{seconds:.4f}", int(correct)])
+
+# Leaderboard Storage
+
+@contextmanager
+def results_lock():
+    """Holds an exclusive lock on the results files while writing."""
+    with open(LOCK_FILE, 'a+') as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        else:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+def rank_key(score, time_taken, max_streak):
+    """
+    Orders sessions for the leaderboard: higher score, then faster time, then longer streak.
+
+    :return: A tuple where a larger value means a better session.
+    """
+    return (score, -time_taken, max_streak)
+
+def push_top(heap, entry):
+    """
+    Keeps a min-heap of the best LEADERBOARD_SIZE entries.
+
+    :param heap: A list of [score, -time, streak] entries, in heap order.
+    :param entry: The new entry.
+    """
+    if len(heap) < LEADERBOARD_SIZE:
+        heapq.heappush(heap, entry)
+    elif entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
+def log_size():
+    """Returns the size of the results log in bytes (0 if it does not exist yet)."""
+    try:
+        return os.path.getsize(RESULTS_FILE)
+    except OSError:
+        return 0
+
+def read_index():
+    """
+    Reads the leaderboard index.
+
+    The index records how many bytes of the results log it covers, so an index
+    that fell behind the log (e.g. a crash between the two writes) can be caught up.
+
+    :return: A dict {"size": bytes, "levels": {"1".."3": heap}}, or None if missing or damaged.
+    """
+    try:
+        with open(LEADERBOARD_FILE, 'r') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # Valid JSON can still be the wrong shape; treat that as damaged too
+    if not isinstance(index, dict) or set(index) != {"size", "levels"}:
+        return None
+    size, levels = index["size"], index["levels"]
+    if not isinstance(size, int) or isinstance(size, bool) or size < 0:
+        return None
+    if not isinstance(levels, dict) or not set(levels) <= {"1", "2", "3"}:
+        return None
+    for heap in levels.values():
+        if not isinstance(heap, list) or len(heap) > LEADERBOARD_SIZE:
+            return None
+        for entry in heap:
+            if not (isinstance(entry, list) and len(entry) == 3
+                    and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in entry)):
+                return None
+        heapq.heapify(heap)
+    return index
+
+def write_index(index):
+    """Replaces the leaderboard index in one step so readers never see half a file."""
+    tmp = LEADERBOARD_FILE + ".tmp"
+    with open(tmp, 'w') as f:
+        json.dump(index, f)
+    os.replace(tmp, LEADERBOARD_FILE)
+
+def replay_log(levels, offset):
+    """
+    Adds every session in the results log after offset to the leaderboard heaps.
+
+    :param levels: The heaps to update, keyed by difficulty as a string.
+    :param offset: The byte position in the log to start reading from.
+    """
+    with open(RESULTS_FILE, 'rb') as f:
+        f.seek(offset)
+        for row in csv.reader(line.decode('utf-8', 'replace') for line in f):
+            try:
+                difficulty, score, time_taken, max_streak = int(row[0]), int(row[1]), float(row[2]), int(row[3])
+            except (ValueError, IndexError):
+                continue  # skip damaged lines
+            if difficulty in (1, 2, 3):
+                push_top(levels.setdefault(str(difficulty), []), list(rank_key(score, time_taken, max_streak)))
+
+def sync_index(index):
+    """
+    Brings the index up to date with the results log. Call while holding results_lock().
+
+    :param index: The index from read_index(), or None to rebuild from scratch.
+    :return: The up-to-date index.
+    """
+    size = log_size()
+    if index is None or index["size"] > size:
+        # Missing, damaged, or the log was truncated: start again
+        index = {"size": 0, "levels": {}}
+    if index["size"] < size or not os.path.exists(LEADERBOARD_FILE):
+        if index["size"] < size:
+            replay_log(index["levels"], index["size"])
+        index["size"] = size
+        write_index(index)
+    return index
+
+def record_session(difficulty, score, time_taken, max_streak):
+    """
+    Appends a finished session to the results log and updates the leaderboard index.
+
+    :param difficulty: The difficulty level played.
+    :param score: The final score.
+    :param time_taken: The total time in seconds.
+    :param max_streak: The longest run of correct answers.
+    """
+    with results_lock():
+        with open(RESULTS_FILE, 'a', newline='') as f:
+            csv.writer(f).writerow([difficulty, score, f"{time_taken:.2f}", max_streak])
+        # Replays only the rows the index has not seen, normally just this one
+        sync_index(read_index())
+
+def load_leaderboard():
+    """
+    Loads the best sessions for each difficulty from the index.
+
+    :return: A dict mapping difficulty (1, 2, 3) to a list of (score, time, streak), best first.
+    """
+    index = read_index()
+    if index is None or index["size"] != log_size():
+        with results_lock():
+            index = sync_index(read_index())
+    board = {}
+    for level in (1, 2, 3):
+        entries = sorted(index["levels"].get(str(level), []), reverse=True)
+        board[level] = [(score, -neg_time, streak) for score, neg_time, streak in entries]
+    return board
+
 # Tkinter GUI Functions
 
 def clear_frame(frame):
@@ -73,10 +284,30 @@ def clear_frame(frame):
     for widget in frame.winfo_children():
         widget.destroy()
 
+def stop_timer(master):
+    """Cancels the live timer if it is running."""
+    if quiz_state.timer_job is not None:
+        master.after_cancel(quiz_state.timer_job)
+        quiz_state.timer_job = None
+
+def show_timer(master):
+    """Displays a Time Elapsed label that keeps updating while the quiz runs."""
+    stop_timer(master)
+    timer_label = tk.Label(master, font=("Helvetica", 10, "italic"))
+    timer_label.pack(pady=5)
+
+    def tick():
+        time_elapsed = int(time.perf_counter() - quiz_state.start_time)
+        timer_label.config(text=f"Time Elapsed: {time_elapsed} seconds")
+        quiz_state.timer_job = master.after(TIMER_INTERVAL_MS, tick)
+
+    tick()
+
 def displayMenu(master):
     """
     A function that displays the difficulty level menu at the beginning of the quiz.
     """
+    stop_timer(master)
     clear_frame(master)
     master.title("🧠 Maths Quiz - Select Difficulty")
     quiz_state.__init__() # Reset game
@@ -100,11 +331,15 @@ def displayMenu(master):
                   width=30, height=2).pack(pady=5)
 
     tk.Label(master, text="Score 10 points for first attempt, 5 points for second.", font=("Helvetica", 10, "italic")).pack(pady=20)
+
+    tk.Button(master, text="🏆 Leaderboard",
+              command=lambda: displayLeaderboard(master),
+              font=("Helvetica", 12, "bold"), bg="#1E90FF", fg="white", width=20).pack()
     
 def start_quiz(master, difficulty):
     """Initializes the quiz and starts the first question."""
     quiz_state.difficulty = difficulty
-    quiz_state.start_time = time.time()
+    quiz_state.start_time = time.perf_counter()
     quiz_state.question_count = 0
     quiz_state.score = 0
     quiz_state.current_streak = 0
@@ -135,7 +370,11 @@ def displayProblem(master):
     A function that displays the question to the user and accepts their answer.
     """
     if quiz_state.question_count >= MAX_QUESTIONS:
-        quiz_state.time_taken = time.time() - quiz_state.start_time
+        quiz_state.time_taken = time.perf_counter() - quiz_state.start_time
+        try:
+            record_session(quiz_state.difficulty, quiz_state.score, quiz_state.time_taken, quiz_state.max_streak)
+        except OSError as e:
+            messagebox.showerror("Leaderboard Error", f"Could not save your result:\n{e}")
         displayResults(master)
         return
 
@@ -158,8 +397,7 @@ def displayProblem(master):
     tk.Label(status_frame, text=f"Streak: {quiz_state.current_streak}", font=("Helvetica", 12, "bold")).pack(side=tk.LEFT, padx=15)
     
     # Time elapsed
-    time_elapsed = int(time.time() - quiz_state.start_time)
-    tk.Label(master, text=f"Time Elapsed: {time_elapsed} seconds", font=("Helvetica", 10, "italic")).pack(pady=5)
+    show_timer(master)
     
     # Problem text
     problem_text = f"{quiz_state.num1} {quiz_state.operation} {quiz_state.num2} = ?"
@@ -177,6 +415,7 @@ def displayProblem(master):
     submit_button.pack(pady=10)
 
     master.bind('<Return>', lambda event: check_answer(master, answer_entry.get()))
+    quiz_state.attempt_start = time.perf_counter()
 
 def check_answer(master, user_input):
     """
@@ -195,6 +434,10 @@ def check_answer(master, user_input):
         return
 
     is_correct = isCorrect(user_answer, quiz_state.current_answer)
+
+    # Response time for this attempt
+    quiz_state.response_times.append((quiz_state.question_count, quiz_state.current_question_attempt,
+                                      time.perf_counter() - quiz_state.attempt_start, is_correct))
     
     if is_correct:
         # Correct Answer 
@@ -237,8 +480,7 @@ def check_answer(master, user_input):
             tk.Label(status_frame, text=f"Streak: {quiz_state.current_streak}", font=("Helvetica", 12, "bold")).pack(side=tk.LEFT, padx=15)
             
             # Time elapsed 
-            time_elapsed = int(time.time() - quiz_state.start_time)
-            tk.Label(master, text=f"Time Elapsed: {time_elapsed} seconds", font=("Helvetica", 10, "italic")).pack(pady=5)
+            show_timer(master)
 
             # Problem 
             problem_text = f"{quiz_state.num1} {quiz_state.operation} {quiz_state.num2} = ?"
@@ -257,6 +499,7 @@ def check_answer(master, user_input):
             
             # Re-bind 
             master.bind('<Return>', lambda event: check_answer(master, answer_entry.get()))
+            quiz_state.attempt_start = time.perf_counter()
 
         else: 
             messagebox.showwarning("Incorrect (2nd Attempt)", 
@@ -286,6 +529,7 @@ def displayResults(master):
     """
     A function that outputs the user's final score and rank.
     """
+    stop_timer(master)
     clear_frame(master)
     
     final_score = quiz_state.score
@@ -313,6 +557,19 @@ def displayResults(master):
     # Stat 2 - Max Streak
     tk.Label(stats_frame, text="Max Correct Streak:", font=("Helvetica", 12)).grid(row=1, column=0, padx=10, sticky='w')
     tk.Label(stats_frame, text=f"{quiz_state.max_streak} questions", font=("Helvetica", 12, "bold")).grid(row=1, column=1, padx=10, sticky='e')
+
+    # Stat 3 - Response times per attempt
+    stats = latency_stats([seconds for _, _, seconds, _ in quiz_state.response_times])
+    if stats:
+        tk.Label(stats_frame, text="Response Time:", font=("Helvetica", 12)).grid(row=2, column=0, padx=10, sticky='w')
+        tk.Label(stats_frame, text=f"avg {stats['mean']:.2f}s • p50 {stats['p50']:.2f}s • p95 {stats['p95']:.2f}s",
+                 font=("Helvetica", 12, "bold")).grid(row=2, column=1, padx=10, sticky='e')
+        tk.Label(stats_frame, text="Slowest Answer:", font=("Helvetica", 12)).grid(row=3, column=0, padx=10, sticky='w')
+        tk.Label(stats_frame, text=f"{stats['slowest']:.2f} seconds", font=("Helvetica", 12, "bold")).grid(row=3, column=1, padx=10, sticky='e')
+
+        tk.Button(master, text="Export Timings (CSV)",
+                  command=lambda: save_latency_log(master),
+                  font=("Helvetica", 10), width=20).pack()
     
     # Replay Prompt
     tk.Label(master, text="Would you like to play again?", font=("Helvetica", 14)).pack(pady=10)
@@ -325,17 +582,74 @@ def displayResults(master):
               command=lambda: displayMenu(master),
               font=("Helvetica", 12, "bold"), bg="#3CB371", fg="white", width=15).pack(side=tk.LEFT, padx=10)
               
+    tk.Button(button_frame, text="Leaderboard",
+              command=lambda: displayLeaderboard(master),
+              font=("Helvetica", 12, "bold"), bg="#1E90FF", fg="white", width=12).pack(side=tk.LEFT, padx=10)
+
     tk.Button(button_frame, text="Exit Quiz", 
               command=master.quit,
               font=("Helvetica", 12, "bold"), bg="#696969", fg="white", width=15).pack(side=tk.RIGHT, padx=10)
 
 
+def displayLeaderboard(master):
+    """
+    A function that displays the best sessions for each difficulty level.
+    """
+    stop_timer(master)
+    clear_frame(master)
+    master.title("🏆 Maths Quiz - Leaderboard")
+
+    tk.Label(master, text="LEADERBOARD", font=("Helvetica", 24, "bold"), fg="#1E90FF").pack(pady=(20, 10))
+
+    try:
+        board = load_leaderboard()
+    except OSError as e:
+        messagebox.showerror("Leaderboard Error", f"Could not load the leaderboard:\n{e}")
+        board = {1: [], 2: [], 3: []}
+
+    level_names = {1: "Easy", 2: "Moderate", 3: "Advanced"}
+    table = tk.Frame(master)
+    table.pack(pady=5)
+
+    row = 0
+    for level, entries in board.items():
+        tk.Label(table, text=level_names[level], font=("Helvetica", 13, "bold"), fg="#8B0000").grid(row=row, column=0, columnspan=4, sticky='w', pady=(8, 0))
+        row += 1
+        if not entries:
+            tk.Label(table, text="No results yet", font=("Helvetica", 10, "italic")).grid(row=row, column=0, columnspan=4, sticky='w', padx=10)
+            row += 1
+        for place, (score, time_taken, max_streak) in enumerate(entries, start=1):
+            tk.Label(table, text=f"{place}.", font=("Helvetica", 10)).grid(row=row, column=0, padx=10, sticky='w')
+            tk.Label(table, text=f"{score} pts", font=("Helvetica", 10, "bold")).grid(row=row, column=1, padx=10, sticky='e')
+            tk.Label(table, text=f"{time_taken:.2f} s", font=("Helvetica", 10)).grid(row=row, column=2, padx=10, sticky='e')
+            tk.Label(table, text=f"streak {max_streak}", font=("Helvetica", 10)).grid(row=row, column=3, padx=10, sticky='e')
+            row += 1
+
+    tk.Button(master, text="Back to Menu",
+              command=lambda: displayMenu(master),
+              font=("Helvetica", 12, "bold"), bg="#3CB371", fg="white", width=15).pack(pady=15)
+
+def save_latency_log(master):
+    """Asks for a file name and exports the session's response times."""
+    path = filedialog.asksaveasfilename(parent=master, title="Export Timings",
+                                        defaultextension=".csv",
+                                        filetypes=[("CSV files", "*.csv")])
+    if not path:
+        return
+    try:
+        export_latency_log(path, quiz_state.response_times)
+    except OSError as e:
+        messagebox.showerror("Export Error", f"Could not save timings:\n{e}")
+        return
+    messagebox.showinfo("Exported", f"Saved {len(quiz_state.response_times)} response times.")
+
+
 # [Main Application]
 
 def main():
     """Initializes and runs the Tkinter application."""
     root = tk.Tk()
-    root.geometry("500x500") 
+    root.geometry("500x580") 
     root.resizable(False, False)
     
     # The difficulty selection menu
@@ -1,31 +1,88 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
 import os
+import threading
+import csv
+import json
+from itertools import islice
 
 # Student Class 
 class Student:
+    # Derived marks are cached and only recalculated when cw or exam change
+    __slots__ = ("code", "_name", "_cw", "_exam",
+                 "_total_cw", "_total", "_percentage", "_grade", "on_change")
+
     def __init__(self, code, name, cw1, cw2, cw3, exam):
         self.code = int(code)
-        self.name = name.strip()
-        self.cw = [int(cw1), int(cw2), int(cw3)]
-        self.exam = int(exam)
+        self._name = name.strip()
+        self._cw = (int(cw1), int(cw2), int(cw3))
+        self._exam = int(exam)
+        self.on_change = None   # called with (student, field, old value) after an edit
+        self._recalculate()
+
+    def _recalculate(self):
+        self._total_cw = sum(self._cw)
+        self._total = self._total_cw + self._exam
+        self._percentage = (self._total / 160) * 100
+        p = self._percentage
+        if p >= 70: self._grade = 'A'
+        elif p >= 60: self._grade = 'B'
+        elif p >= 50: self._grade = 'C'
+        elif p >= 40: self._grade = 'D'
+        else: self._grade = 'F'
+
+    def _changed(self, field, old):
+        if field != "name":
+            self._recalculate()
+        if self.on_change:
+            self.on_change(self, field, old)
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        old, self._name = self._name, value.strip()
+        if self._name != old:
+            self._changed("name", old)
+
+    @property
+    def cw(self):
+        return self._cw
+
+    @cw.setter
+    def cw(self, marks):
+        old, self._cw = self._cw, tuple(int(m) for m in marks)
+        if self._cw != old:
+            self._changed("cw", old)
+
+    def set_cw(self, index, mark):
+        marks = list(self._cw)
+        marks[index] = mark
+        self.cw = marks
+
+    @property
+    def exam(self):
+        return self._exam
+
+    @exam.setter
+    def exam(self, value):
+        old, self._exam = self._exam, int(value)
+        if self._exam != old:
+            self._changed("exam", old)
 
     def total_cw(self):
-        return sum(self.cw)
+        return self._total_cw
 
     def total_score(self):
-        return self.total_cw() + self.exam
+        return self._total
 
     def percentage(self):
-        return (self.total_score() / 160) * 100
+        return self._percentage
 
     def grade(self):
-        p = self.percentage()
-        if p >= 70: return 'A'
-        elif p >= 60: return 'B'
-        elif p >= 50: return 'C'
-        elif p >= 40: return 'D'
-        else: return 'F'
+        return self._grade
 
 # File Handling
 FILENAME = "studentMarks.txt"
@@ -50,14 +107,254 @@ def load_students():
         messagebox.showerror("Load Error", f"Error reading file:\n{e}")
     return students
 
-def save_students(students):
-    try:
-        with open(FILENAME, 'w') as f:
-            f.write(f"{len(students)}\n")
-            for s in students:
-                f.write(f"{s.code},{s.name},{s.cw[0]},{s.cw[1]},{s.cw[2]},{s.exam}\n")
-    except Exception as e:
-        messagebox.showerror("Save Error", f"Could not save:\n{e}")
+def student_rows(students):
+    # Plain tuples so a background thread never touches live Student objects
+    return [(s.code, s.name, s.cw[0], s.cw[1], s.cw[2], s.exam) for s in students]
+
+def write_rows(rows):
+    tmp = FILENAME + ".tmp"
+    with open(tmp, 'w') as f:
+        f.write(f"{len(rows)}\n")
+        for row in rows:
+            f.write(",".join(str(v) for v in row) + "\n")
+    os.replace(tmp, FILENAME)
+
+# Bulk Import / Export
+IMPORT_BATCH_SIZE = 500
+IMPORT_FIELDS = ("code", "name", "cw1", "cw2", "cw3", "exam")
+
+def iter_import_rows(path):
+    # Yields (line number, list of fields) without loading the whole file
+    # utf-8-sig drops the byte order mark Excel puts at the start of "CSV UTF-8" files
+    with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    yield line_no, [record[k] for k in IMPORT_FIELDS]
+                except (ValueError, KeyError, TypeError) as e:
+                    yield line_no, e
+        else:
+            reader = csv.reader(f)
+            first = True
+            for parts in reader:
+                if not parts or not any(p.strip() for p in parts):
+                    continue
+                # Skip a studentMarks.txt count line or a header row such as "Student ID,Name,..."
+                if first:
+                    first = False
+                    head = parts[0].strip()
+                    if len(parts) == 1 or not head.isdigit():
+                        continue
+                yield reader.line_num, parts
+
+def parse_whole(value):
+    # Only real integers or digit strings; 12.9 or true must not become 12 or 1
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    raise ValueError(value)
+
+def validate_batch(batch, known_codes):
+    # Returns (students, errors) and adds accepted codes to known_codes
+    students, errors = [], []
+    for line_no, parts in batch:
+        if isinstance(parts, Exception):
+            errors.append((line_no, f"unreadable record ({parts})"))
+            continue
+        if len(parts) != 6:
+            errors.append((line_no, f"expected 6 fields, got {len(parts)}"))
+            continue
+        code, name, *marks = parts
+        try:
+            code = parse_whole(code)
+            marks = [parse_whole(m) for m in marks]
+        except ValueError:
+            errors.append((line_no, "ID and marks must be whole numbers"))
+            continue
+        if not isinstance(name, str):
+            errors.append((line_no, "name must be text"))
+            continue
+        name = name.strip()
+        if not 1000 <= code <= 9999:
+            errors.append((line_no, f"ID {code} is outside 1000-9999"))
+        elif code in known_codes:
+            errors.append((line_no, f"duplicate ID {code}"))
+        elif not name:
+            errors.append((line_no, "name is empty"))
+        elif any(c in name for c in ",\r\n"):
+            # studentMarks.txt is plain comma separated, so these would corrupt it
+            errors.append((line_no, "name must not contain commas or line breaks"))
+        elif not all(0 <= m <= 20 for m in marks[:3]):
+            errors.append((line_no, "coursework marks must be 0-20"))
+        elif not 0 <= marks[3] <= 100:
+            errors.append((line_no, "exam mark must be 0-100"))
+        else:
+            known_codes.add(code)
+            students.append(Student(code, name, *marks))
+    return students, errors
+
+def import_students(path, known_codes):
+    rows = iter_import_rows(path)
+    students, errors = [], []
+    while True:
+        batch = list(islice(rows, IMPORT_BATCH_SIZE))
+        if not batch:
+            break
+        ok, bad = validate_batch(batch, known_codes)
+        students.extend(ok)
+        errors.extend(bad)
+    return students, errors
+
+def write_error_report(path, errors):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["line", "error"])
+        writer.writerows(errors)
+
+def iter_graded_rows(students):
+    # Generator so exports never build the whole graded table in memory
+    yield ("Student ID", "Name", "CW Total", "Exam", "Total", "Percentage", "Grade")
+    for s in students:
+        yield (s.code, s.name, s.total_cw(), s.exam, s.total_score(), f"{s.percentage():.1f}", s.grade())
+
+def export_graded(path, students):
+    with open(path, 'w', newline='') as f:
+        csv.writer(f).writerows(iter_graded_rows(students))
+
+# Query Pipeline
+PAGE_SIZE = 50          # rows shown before the rest of the table is streamed in
+RENDER_CHUNK = 500
+
+GRADE_COLORS = {
+    'A': '#27ae60', 'B': '#3498db', 'C': '#f39c12',
+    'D': '#e67e22', 'F': '#e74c3c'
+}
+
+SORT_KEYS = {
+    "Name": lambda s: s.name.lower(),
+    "Student ID": lambda s: s.code,
+    "CW Total /60": lambda s: s.total_cw(),
+    "Exam /100": lambda s: s.exam,
+    "Total /160": lambda s: s.total_score(),
+    "Percentage": lambda s: s.percentage(),
+    "Grade": lambda s: s.grade(),
+}
+
+def grade_in(grades):
+    return lambda s: s.grade() in grades
+
+def exam_above(mark):
+    return lambda s: s.exam > mark
+
+def cw_below(total):
+    return lambda s: s.total_cw() < total
+
+def name_prefix(prefix):
+    prefix = prefix.lower()
+    return lambda s: s.name.lower().startswith(prefix)
+
+def run_query(students, predicates=(), sort_keys=()):
+    # Filtering stays lazy; sorting has to see every match, so it materialises
+    # Iterate over a snapshot: the table is streamed across root.after ticks and
+    # the roster may be edited (delete, import) before the last row is read
+    rows = (s for s in list(students) if all(p(s) for p in predicates))
+    if sort_keys:
+        rows = list(rows)
+        # Stable sorts applied from the least to the most significant column
+        for column, reverse in reversed(sort_keys):
+            rows.sort(key=SORT_KEYS[column], reverse=reverse)
+    return rows
+
+# Autosave
+AUTOSAVE_DELAY_MS = 800
+AUTOSAVE_POLL_MS = 50
+
+class AutoSaver:
+    """Coalesces bursts of edits into background writes of the roster.
+
+    At most one write is in flight; edits made meanwhile leave one pending
+    write that starts as soon as the current one finishes.
+    """
+    def __init__(self, root, get_students, on_state):
+        self.root = root
+        self.get_students = get_students
+        self.on_state = on_state    # called with "unsaved", "saving", "saved" or "error"
+        self.dirty = False
+        self.pending = False
+        self.error = None
+        self._timer = None
+        self._thread = None
+
+    def mark_dirty(self):
+        self.dirty = True
+        self.on_state("unsaved")
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+        self._timer = self.root.after(AUTOSAVE_DELAY_MS, self._start_write)
+
+    def _start_write(self):
+        self._timer = None
+        if self._thread is not None:
+            self.pending = True
+            return
+        rows = student_rows(self.get_students())
+        self.dirty = False
+        self.error = None
+        self.on_state("saving")
+        self._thread = threading.Thread(target=self._write, args=(rows,), daemon=True)
+        self._thread.start()
+        self.root.after(AUTOSAVE_POLL_MS, self._poll)
+
+    def _write(self, rows):
+        try:
+            write_rows(rows)
+        except Exception as e:
+            self.error = e
+
+    def _poll(self):
+        if self._thread is None:
+            return  # already collected by flush()
+        if self._thread.is_alive():
+            self.root.after(AUTOSAVE_POLL_MS, self._poll)
+            return
+        self._thread = None
+        if self.error is not None:
+            self.dirty = True
+            self.on_state("error")
+        if self.pending:
+            self.pending = False
+            self._start_write()
+        elif self.error is None:
+            self.on_state("unsaved" if self.dirty else "saved")
+
+    def flush(self):
+        """Blocks until every change is on disk. Used when the window closes.
+
+        Returns False if the final write failed; the roster stays dirty.
+        """
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+            self._timer = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.dirty or self.pending or self.error is not None:
+            self.pending = False
+            self.error = None
+            try:
+                write_rows(student_rows(self.get_students()))
+            except Exception as e:
+                self.error = e
+                self.dirty = True
+                self.on_state("error")
+                return False
+            self.dirty = False
+            self.on_state("saved")
+        return True
 
 #  Main App 
 class StudentManagerApp:
@@ -69,10 +366,30 @@ class StudentManagerApp:
         self.root.resizable(True, True)
 
         self.students = load_students()
+        self.by_code = {}
+        self.by_name = {}       # lower-case name -> [students]
+        duplicates = set()
+        for s in self.students:
+            if s.code in self.by_code:
+                duplicates.add(s.code)
+            self.track(s)
+        duplicates = sorted(duplicates)
+        self.filter_values = {"grades": "", "exam": "", "cw": "", "prefix": ""}
+        self.predicates = []
+        self.sort_keys = []     # [(column, descending)], most significant first
+        self._render_job = None
 
         self.setup_styles()
         self.create_layout()
         self.update_status(f"Loaded {len(self.students)} students")
+        if duplicates:
+            messagebox.showwarning("Duplicate IDs",
+                                   f"{FILENAME} has more than one student with ID:\n"
+                                   + ", ".join(map(str, duplicates))
+                                   + "\n\nSearching by ID finds the first of each.")
+
+        self.autosave = AutoSaver(self.root, lambda: self.students, self.update_save_state)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def setup_styles(self):
         style = ttk.Style()
@@ -91,7 +408,7 @@ class StudentManagerApp:
         # Button style
         style.configure("Card.TButton", 
                         font=("Helvetica", 11, "bold"),
-                        padding=(20, 12),
+                        padding=(8, 12),
                         background=accent,
                         foreground="white")
         style.map("Card.TButton",
@@ -116,6 +433,10 @@ class StudentManagerApp:
         style.configure("Title.TLabel", font=("Helvetica", 28, "bold"), foreground=accent, background=bg)
         style.configure("Subtitle.TLabel", font=("Helvetica", 12), foreground="#7f8c8d", background=bg)
         style.configure("Status.TLabel", font=("Segoe UI", 10), foreground="#2ecc71", background="#ecf0f1", padding=10)
+        style.configure("Saved.TLabel", font=("Segoe UI", 10, "bold"), foreground=success, background="#ecf0f1", padding=10)
+        style.configure("Saving.TLabel", font=("Segoe UI", 10, "bold"), foreground=accent_hover, background="#ecf0f1", padding=10)
+        style.configure("Unsaved.TLabel", font=("Segoe UI", 10, "bold"), foreground=warning, background="#ecf0f1", padding=10)
+        style.configure("Error.TLabel", font=("Segoe UI", 10, "bold"), foreground=danger, background="#ecf0f1", padding=10)
 
     def create_layout(self):
         # Top Header
@@ -136,7 +457,7 @@ class StudentManagerApp:
         left_panel = tk.Frame(main_container, bg="white", relief=tk.RAISED, bd=1)
         left_panel.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 20))
         left_panel.pack_propagate(False)
-        left_panel.configure(width=300)
+        left_panel.configure(width=360)
 
         tk.Label(left_panel, text="Actions", font=("Helvetica", 16, "bold"), bg="white", fg="#000000").pack(pady=(25, 15))
 
@@ -146,14 +467,21 @@ class StudentManagerApp:
             ("Top Performer", self.show_highest),
             ("Lowest Score", self.show_lowest),
             ("Sort Records", self.sort_records),
+            ("Filter Records", self.filter_records),
             ("Add New Student", self.add_student),
             ("Delete Student", self.delete_student),
             ("Update Record", self.update_student),
+            ("Import Records", self.import_records),
+            ("Export Grades", self.export_records),
         ]
 
-        for text, cmd in actions:
-            btn = ttk.Button(left_panel, text=text, style="Card.TButton", command=cmd)
-            btn.pack(pady=9, padx=25, fill=tk.X)
+        # Two columns keep every action visible without a taller window
+        grid = tk.Frame(left_panel, bg="white")
+        grid.pack(padx=15, fill=tk.X)
+        grid.columnconfigure((0, 1), weight=1, uniform="actions")
+        for i, (text, cmd) in enumerate(actions):
+            btn = ttk.Button(grid, text=text, style="Card.TButton", command=cmd)
+            btn.grid(row=i // 2, column=i % 2, padx=5, pady=6, sticky=tk.EW)
 
         # Right Panel - Data Display
         right_panel = tk.Frame(main_container, bg="white", relief=tk.RAISED, bd=1)
@@ -164,7 +492,7 @@ class StudentManagerApp:
         self.tree = ttk.Treeview(right_panel, columns=columns, show="headings", style="Modern.Treeview")
 
         for col in columns:
-            self.tree.heading(col, text=col, anchor=tk.CENTER)
+            self.tree.heading(col, text=col, anchor=tk.CENTER, command=lambda c=col: self.sort_by_heading(c))
             self.tree.column(col, anchor=tk.CENTER, width=130)
         self.tree.column("Name", width=200, anchor=tk.W)
         self.tree.column("Grade", width=90)
@@ -176,38 +504,66 @@ class StudentManagerApp:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Status Bar
+        status_bar = tk.Frame(self.root)
+        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+
+        self.save_label = ttk.Label(status_bar, text="✓ All changes saved", style="Saved.TLabel", relief=tk.SUNKEN)
+        self.save_label.pack(side=tk.RIGHT)
+
         self.status_var = tk.StringVar()
         self.status_var.set("Ready • System loaded successfully")
-        status = ttk.Label(self.root, textvariable=self.status_var, style="Status.TLabel", relief=tk.SUNKEN, anchor=tk.W)
-        status.pack(side=tk.BOTTOM, fill=tk.X)
+        status = ttk.Label(status_bar, textvariable=self.status_var, style="Status.TLabel", relief=tk.SUNKEN, anchor=tk.W)
+        status.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
     def update_status(self, msg):
         self.status_var.set(f"Status: {msg}")
 
+    def update_save_state(self, state):
+        text, style = {
+            "unsaved": ("● Unsaved changes", "Unsaved.TLabel"),
+            "saving": ("⟳ Saving...", "Saving.TLabel"),
+            "saved": ("✓ All changes saved", "Saved.TLabel"),
+        }.get(state, (f"✗ Save failed: {self.autosave.error}", "Error.TLabel"))
+        self.save_label.config(text=text, style=style)
+
+    def on_close(self):
+        if not self.autosave.flush():
+            # Keep the window open unless the user accepts losing the edits
+            if not messagebox.askyesno("Unsaved Changes",
+                                       f"Could not save changes:\n{self.autosave.error}\n\nQuit anyway and lose them?",
+                                       icon=messagebox.WARNING, parent=self.root):
+                return
+        self.root.destroy()
+
     def clear_tree(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        if self._render_job is not None:
+            self.root.after_cancel(self._render_job)
+            self._render_job = None
+        self.tree.delete(*self.tree.get_children())
 
     def display_students(self, stu_list):
         self.clear_tree()
-        if not stu_list:
+        rows = iter(stu_list)
+        first_page = list(islice(rows, PAGE_SIZE))
+        if not first_page:
             self.update_status("No students found")
             return
 
-        total_perc = sum(s.percentage() for s in stu_list)
-        avg = total_perc / len(stu_list)
+        for grade, color in GRADE_COLORS.items():
+            self.tree.tag_configure(f"grade_{grade}", foreground=color, font=("Segoe UI", 10, "bold"))
 
+        shown = [0, 0.0]    # rows inserted, sum of percentages
+        self.insert_rows(first_page, shown)
+        if len(first_page) < PAGE_SIZE:
+            self.finish_display(shown)
+            return
+        self.update_status(f"Showing first {shown[0]} students • loading more...")
+        self._render_job = self.root.after(1, self.stream_rows, rows, shown)
+
+    def insert_rows(self, stu_list, shown):
         for s in stu_list:
             perc = s.percentage()
             grade = s.grade()
-            color = {
-                'A': '#27ae60', 'B': '#3498db', 'C': '#f39c12',
-                'D': '#e67e22', 'F': '#e74c3c'
-            }.get(grade, '#7f8c8d')
-
-            tag = f"grade_{grade}"
-            self.tree.tag_configure(tag, foreground=color, font=("Segoe UI", 10, "bold"))
-
             self.tree.insert("", tk.END, values=(
                 s.name,
                 s.code,
@@ -216,12 +572,66 @@ class StudentManagerApp:
                 s.total_score(),
                 f"{perc:.1f}%",
                 grade
-            ), tags=(tag,))
+            ), tags=(f"grade_{grade}",))
+            shown[0] += 1
+            shown[1] += perc
+
+    def stream_rows(self, rows, shown):
+        chunk = list(islice(rows, RENDER_CHUNK))
+        self.insert_rows(chunk, shown)
+        if len(chunk) == RENDER_CHUNK:
+            self._render_job = self.root.after(1, self.stream_rows, rows, shown)
+        else:
+            self._render_job = None
+            self.finish_display(shown)
+
+    def finish_display(self, shown):
+        count, total_perc = shown
+        avg = total_perc / count
+        self.update_status(f"Showing {count} students • Class Average: {avg:.2f}%")
 
-        self.update_status(f"Showing {len(stu_list)} students • Class Average: {avg:.2f}%")
+    def refresh(self):
+        self.update_headings()
+        self.display_students(run_query(self.students, self.predicates, self.sort_keys))
 
     def view_all(self):
-        self.display_students(self.students)
+        self.filter_values = dict.fromkeys(self.filter_values, "")
+        self.predicates = []
+        self.refresh()
+
+    def track(self, s):
+        s.on_change = self.student_changed
+        # The first student keeps the ID if the file holds duplicates
+        self.by_code.setdefault(s.code, s)
+        self.by_name.setdefault(s.name.lower(), []).append(s)
+
+    def untrack(self, s):
+        # Call after removing s from self.students
+        s.on_change = None
+        if self.by_code.get(s.code) is s:
+            del self.by_code[s.code]
+            other = next((o for o in self.students if o.code == s.code), None)
+            if other:
+                self.by_code[s.code] = other
+        self.remove_name(s, s.name)
+
+    def remove_name(self, s, name):
+        matches = self.by_name[name.lower()]
+        matches.remove(s)
+        if not matches:
+            del self.by_name[name.lower()]
+
+    def student_changed(self, s, field, old):
+        # Keep the lookup indexes in step with edits, then schedule a save
+        if field == "name":
+            self.remove_name(s, old)
+            # Keep the bucket in roster order so find_student returns the first
+            # match in self.students, as the old linear search did
+            matches = self.by_name.setdefault(s.name.lower(), [])
+            pos = self.students.index(s)
+            at = next((i for i, o in enumerate(matches) if self.students.index(o) > pos), len(matches))
+            matches.insert(at, s)
+        self.autosave.mark_dirty()
 
     def find_student(self):
         query = simpledialog.askstring("Search Student", 
@@ -230,12 +640,11 @@ class StudentManagerApp:
         query = query.strip()
 
         if query.isdigit():
-            code = int(query)
-            for s in self.students:
-                if s.code == code: return s
+            s = self.by_code.get(int(query))
+            if s: return s
         else:
-            for s in self.students:
-                if s.name.lower() == query.lower(): return s
+            matches = self.by_name.get(query.lower())
+            if matches: return matches[0]
 
         messagebox.showwarning("Not Found", "No student found with that name or ID.")
         return None
@@ -244,6 +653,7 @@ class StudentManagerApp:
         s = self.find_student()
         if s:
             self.clear_tree()
+            self.update_headings(show_sort=False)
             perc = s.percentage()
             grade = s.grade()
             tag = f"grade_{grade}"
@@ -260,6 +670,7 @@ class StudentManagerApp:
             return
         best = max(self.students, key=lambda x: x.percentage())
         self.clear_tree()
+        self.update_headings(show_sort=False)
         self.tree.insert("", tk.END, values=(
             best.name, best.code, best.total_cw(), best.exam,
             best.total_score(), f"{best.percentage():.1f}%", best.grade()
@@ -273,6 +684,7 @@ class StudentManagerApp:
             return
         worst = min(self.students, key=lambda x: x.percentage())
         self.clear_tree()
+        self.update_headings(show_sort=False)
         self.tree.insert("", tk.END, values=(
             worst.name, worst.code, worst.total_cw(), worst.exam,
             worst.total_score(), f"{worst.percentage():.1f}%", worst.grade()
@@ -286,17 +698,91 @@ class StudentManagerApp:
             "Choose sort field:\n1. Name\n2. Student ID\n3. Percentage\n\nEnter 1, 2 or 3:", parent=self.root)
         reverse = messagebox.askyesno("Sort Order", "Descending order? (Highest first)", parent=self.root)
 
-        key = {"1": lambda s: s.name.lower(), "2": lambda s: s.code, "3": lambda s: s.percentage()}.get(choice)
-        if not key:
+        column = {"1": "Name", "2": "Student ID", "3": "Percentage"}.get(choice)
+        if not column:
             messagebox.showerror("Invalid", "Please enter 1, 2, or 3")
             return
 
-        sorted_list = sorted(self.students, key=key, reverse=reverse)
-        self.display_students(sorted_list)
+        self.sort_keys = [(column, reverse)]
+        self.refresh()
+
+    def sort_by_heading(self, column):
+        # Clicking the primary column flips it; any other column becomes primary
+        if self.sort_keys and self.sort_keys[0][0] == column:
+            self.sort_keys[0] = (column, not self.sort_keys[0][1])
+        else:
+            self.sort_keys = [(column, False)] + [k for k in self.sort_keys if k[0] != column]
+        self.refresh()
+
+    def update_headings(self, show_sort=True):
+        # Sort markers only make sense while the table shows a query result
+        order = {col: (i, rev) for i, (col, rev) in enumerate(self.sort_keys)} if show_sort else {}
+        for col in self.tree["columns"]:
+            text = col
+            if col in order:
+                i, rev = order[col]
+                text = f"{col} {'▼' if rev else '▲'}" + (f"{i + 1}" if len(order) > 1 else "")
+            self.tree.heading(col, text=text)
+
+    def filter_records(self):
+        win = tk.Toplevel(self.root)
+        win.title("Filter Records")
+        win.transient(self.root)
+        win.resizable(False, False)
+
+        fields = [
+            ("grades", "Grades (e.g. A,B):"),
+            ("exam", "Exam mark above:"),
+            ("cw", "CW total below:"),
+            ("prefix", "Name starts with:"),
+        ]
+        entries = {}
+        for row, (key, label) in enumerate(fields):
+            tk.Label(win, text=label, font=("Helvetica", 11)).grid(row=row, column=0, padx=15, pady=6, sticky=tk.W)
+            entry = ttk.Entry(win, width=20)
+            entry.insert(0, self.filter_values[key])
+            entry.grid(row=row, column=1, padx=15, pady=6)
+            entries[key] = entry
+
+        def apply():
+            values = {key: entry.get().strip() for key, entry in entries.items()}
+            predicates = []
+            if values["grades"]:
+                # Commas and spaces separate grades; anything else must be a grade letter
+                grades = set(values["grades"].upper()) - set(", ")
+                if not grades or not grades <= set(GRADE_COLORS):
+                    messagebox.showerror("Invalid", "Grades must be letters A, B, C, D or F.", parent=win)
+                    return
+                predicates.append(grade_in(grades))
+            try:
+                if values["exam"]:
+                    predicates.append(exam_above(int(values["exam"])))
+                if values["cw"]:
+                    predicates.append(cw_below(int(values["cw"])))
+            except ValueError:
+                messagebox.showerror("Invalid", "Marks must be whole numbers.", parent=win)
+                return
+            if values["prefix"]:
+                predicates.append(name_prefix(values["prefix"]))
+
+            self.filter_values = values
+            self.predicates = predicates
+            win.destroy()
+            self.refresh()
+
+        def clear():
+            win.destroy()
+            self.view_all()
+
+        buttons = tk.Frame(win)
+        buttons.grid(row=len(fields), column=0, columnspan=2, pady=12)
+        ttk.Button(buttons, text="Apply", command=apply).pack(side=tk.LEFT, padx=8)
+        ttk.Button(buttons, text="Clear", command=clear).pack(side=tk.LEFT, padx=8)
+        win.bind('<Return>', lambda event: apply())
 
     def add_student(self):
         code = simpledialog.askinteger("Add Student", "Student ID (1000-9999):", minvalue=1000, maxvalue=9999)
-        if not code or any(s.code == code for s in self.students):
+        if not code or code in self.by_code:
             messagebox.showerror("Error", "Invalid or duplicate ID!")
             return
         name = simpledialog.askstring("Add Student", "Full Name:")
@@ -313,8 +799,10 @@ class StudentManagerApp:
         exam = ask("Exam Mark (0-100):", 100)
         if exam is None: return
 
-        self.students.append(Student(code, name, *cw, exam))
-        save_students(self.students)
+        s = Student(code, name, *cw, exam)
+        self.students.append(s)
+        self.track(s)
+        self.autosave.mark_dirty()
         self.update_status(f"Added: {name}")
         messagebox.showinfo("Success", f"Student '{name}' added successfully!")
 
@@ -323,7 +811,8 @@ class StudentManagerApp:
         if not s: return
         if messagebox.askyesno("Confirm Delete", f"Permanently delete {s.name} ({s.code})?"):
             self.students.remove(s)
-            save_students(self.students)
+            self.untrack(s)
+            self.autosave.mark_dirty()
             self.update_status(f"Deleted: {s.name}")
             messagebox.showinfo("Deleted", "Student record removed.")
 
@@ -344,15 +833,65 @@ class StudentManagerApp:
             if new: s.name = new.strip()
         elif idx <= 3:
             new = simpledialog.askinteger("Update", f"New Coursework {idx} (0-20):", minvalue=0, maxvalue=20)
-            if new is not None: s.cw[idx-1] = new
+            if new is not None: s.set_cw(idx-1, new)
         else:
             new = simpledialog.askinteger("Update", "New Exam Mark (0-100):", minvalue=0, maxvalue=100)
             if new is not None: s.exam = new
 
-        save_students(self.students)
+        # The edit notifies student_changed, which updates the indexes and autosaves
         self.update_status(f"Updated: {s.name}")
         messagebox.showinfo("Updated", "Student record updated!")
 
+    def import_records(self):
+        path = filedialog.askopenfilename(parent=self.root, title="Import Students",
+                                          filetypes=[("Roster files", "*.csv *.txt *.jsonl"), ("All files", "*.*")])
+        if not path: return
+        try:
+            added, errors = import_students(path, set(self.by_code))
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            messagebox.showerror("Import Error", f"Could not read file:\n{e}")
+            return
+
+        if added:
+            self.students.extend(added)
+            for s in added:
+                self.track(s)
+            self.autosave.mark_dirty()
+            self.refresh()
+        self.update_status(f"Imported {len(added)} students • {len(errors)} rejected")
+
+        if errors:
+            preview = "\n".join(f"Line {n}: {msg}" for n, msg in errors[:10])
+            if len(errors) > 10:
+                preview += f"\n... and {len(errors) - 10} more"
+            messagebox.showwarning("Import Finished",
+                                   f"Added {len(added)} students, rejected {len(errors)} rows:\n\n{preview}"
+                                   "\n\nChoose where to save the full error report next.")
+            report = filedialog.asksaveasfilename(parent=self.root, title="Save Error Report",
+                                                  initialfile=os.path.splitext(os.path.basename(path))[0] + "_errors.csv",
+                                                  defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
+            if report:
+                try:
+                    write_error_report(report, errors)
+                except OSError as e:
+                    messagebox.showerror("Report Error", f"Could not save the error report:\n{e}")
+        else:
+            messagebox.showinfo("Import Finished", f"Added {len(added)} students.")
+
+    def export_records(self):
+        if not self.students:
+            messagebox.showinfo("Empty", "No student records.")
+            return
+        path = filedialog.asksaveasfilename(parent=self.root, title="Export Grades",
+                                            defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
+        if not path: return
+        try:
+            export_graded(path, self.students)
+        except OSError as e:
+            messagebox.showerror("Export Error", f"Could not export:\n{e}")
+            return
+        self.update_status(f"Exported {len(self.students)} students to {os.path.basename(path)}")
+
 # ====================== Launch App ======================
 if __name__ == "__main__":
     root = tk.Tk()
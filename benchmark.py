@@ -0,0 +1,378 @@
+"""
+GUI latency benchmarks for the three exercises.
+
+Each app is started in its own process on a virtual display (Xvfb) and driven
+with synthetic button presses. For every interaction the harness records the
+time from the event until Tk is idle again, and how far the peak resident
+memory (RSS) rose above the RSS at the start of the interaction.
+
+    python benchmark.py                     # run and compare with the baselines
+    python benchmark.py --update-baseline   # run and save new baselines
+    python benchmark.py --only students     # run a single app
+
+Results are compared with benchmark_baselines/<app>.json. Baselines depend on
+the machine, so they are not committed: record them once with
+--update-baseline on the machine that runs the checks. The exit code is 1 if
+any interaction got slower or used more memory than the tolerances allow,
+and 2 if an app has no baseline to compare with.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE_DIR = os.path.join(HERE, "benchmark_baselines")
+
+# Regression thresholds
+LATENCY_TOLERANCE = 0.25    # 25% slower than the baseline median
+LATENCY_FLOOR_MS = 2.0      # ignore differences smaller than this (timer noise)
+RSS_TOLERANCE = 0.20        # 20% more peak memory growth
+RSS_FLOOR_KB = 1024         # ignore growth differences smaller than this
+
+ROSTER_SIZE = 5000
+IMPORT_SIZE = 2000
+
+# Child side: runs inside the app's process
+
+PAGE_KB = os.sysconf("SC_PAGE_SIZE") // 1024
+
+def current_rss_kb():
+    """Returns the current resident set size of this process in KB."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * PAGE_KB
+    except OSError:
+        # No /proc (e.g. macOS): fall back to the peak, which only ever rises
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+def reset_peak_rss():
+    """Resets the kernel's RSS high-water mark (VmHWM) to the current RSS. Returns False if unsupported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def peak_rss_kb():
+    """Returns VmHWM, the peak RSS since the last reset_peak_rss(), in KB."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    raise OSError("VmHWM not available")
+
+def wait_idle(root, busy=lambda: False):
+    """Processes events until Tk is idle and the app reports no pending work."""
+    root.update()
+    while busy():
+        root.update()
+        time.sleep(0.0005)
+
+class Recorder:
+    """Collects timings for each named interaction."""
+    def __init__(self, root, busy=lambda: False):
+        self.root = root
+        self.busy = busy
+        self.timings = {}
+        self.growth = {}    # peak RSS above the starting RSS, per run
+        self.peak = {}
+
+    def measure(self, name, action):
+        rss_before = current_rss_kb()
+        has_hwm = reset_peak_rss()
+        start = time.perf_counter()
+        action()
+        wait_idle(self.root, self.busy)
+        elapsed = (time.perf_counter() - start) * 1000
+        try:
+            # Includes memory allocated and freed again during the interaction
+            peak = peak_rss_kb() if has_hwm else current_rss_kb()
+        except OSError:
+            peak = current_rss_kb()     # no VmHWM: only the net change is visible
+        self.timings.setdefault(name, []).append(elapsed)
+        self.growth.setdefault(name, []).append(max(0, peak - rss_before))
+        self.peak[name] = max(peak, self.peak.get(name, 0))
+
+    def summary(self):
+        result = {}
+        for name, times in self.timings.items():
+            ordered = sorted(times)
+            result[name] = {
+                "runs": len(ordered),
+                "median_ms": round(statistics.median(ordered), 3),
+                "p95_ms": round(ordered[max(0, -(-len(ordered) * 95 // 100) - 1)], 3),
+                "max_ms": round(ordered[-1], 3),
+                "peak_growth_kb": max(self.growth[name]),
+                "peak_rss_kb": self.peak[name],
+            }
+        return result
+
+def silence_dialogs(open_path=None, save_path=None):
+    """Replaces modal dialogs, which would wait forever for a user, with instant answers."""
+    from tkinter import messagebox, filedialog
+    for name in ("showinfo", "showwarning", "showerror"):
+        setattr(messagebox, name, lambda *args, **kwargs: "ok")
+    messagebox.askyesno = lambda *args, **kwargs: True
+    filedialog.askopenfilename = lambda *args, **kwargs: open_path
+    filedialog.asksaveasfilename = lambda *args, **kwargs: save_path
+
+def find_button(parent, prefix):
+    """Finds the first Button under parent whose text starts with prefix."""
+    for widget in parent.winfo_children():
+        if widget.winfo_class() in ("Button", "TButton") and str(widget.cget("text")).startswith(prefix):
+            return widget
+        found = find_button(widget, prefix)
+        if found is not None:
+            return found
+    return None
+
+def find_entry(parent):
+    for widget in parent.winfo_children():
+        if widget.winfo_class() == "Entry":
+            return widget
+    return None
+
+def bench_quiz(sessions):
+    import tkinter as tk
+    silence_dialogs()
+
+    start = time.perf_counter()
+    import Exercise1
+    root = tk.Tk()
+    root.geometry("500x580")
+    Exercise1.displayMenu(root)
+    wait_idle(root)
+    startup_ms = (time.perf_counter() - start) * 1000
+
+    rec = Recorder(root)
+    state = Exercise1.quiz_state
+
+    def answer(value):
+        entry = find_entry(root)
+        entry.delete(0, tk.END)
+        entry.insert(0, str(value))
+        find_button(root, "Submit").invoke()
+
+    for session in range(sessions):
+        level = session % 3 + 1
+        rec.measure("start_quiz", lambda: find_button(root, f"{level}.").invoke())
+        for question in range(Exercise1.MAX_QUESTIONS):
+            if question % 3 == 0:
+                # Wrong first, to go through the retry screen
+                rec.measure("wrong_answer", lambda: answer(state.current_answer + 1))
+            rec.measure("correct_answer", lambda: answer(state.current_answer))
+        rec.measure("open_leaderboard", lambda: find_button(root, "Leaderboard").invoke())
+        rec.measure("back_to_menu", lambda: find_button(root, "Back to Menu").invoke())
+
+    Exercise1.stop_timer(root)
+    root.destroy()
+    return startup_ms, rec.summary()
+
+def bench_jokes(rounds):
+    start = time.perf_counter()
+    import Exercise2
+    app = Exercise2.JokeApp()
+    wait_idle(app.root)
+    startup_ms = (time.perf_counter() - start) * 1000
+
+    rec = Recorder(app.root)
+    for _ in range(rounds):
+        rec.measure("tell_joke", app.alexa_btn.invoke)
+        rec.measure("show_punchline", app.show_btn.invoke)
+        rec.measure("next_joke", find_button(app.root, "Next Joke").invoke)
+
+    app.root.destroy()
+    return startup_ms, rec.summary()
+
+def write_roster(path, count, first_code, header=False):
+    rng = random.Random(first_code)
+    with open(path, "w") as f:
+        if header:
+            f.write("code,name,cw1,cw2,cw3,exam\n")
+        else:
+            f.write(f"{count}\n")
+        for i in range(count):
+            marks = [rng.randint(0, 20) for _ in range(3)] + [rng.randint(0, 100)]
+            f.write(f"{first_code + i},Student {first_code + i}," + ",".join(map(str, marks)) + "\n")
+
+def bench_students(rounds):
+    import tkinter as tk
+    write_roster("studentMarks.txt", ROSTER_SIZE, 1000)
+    write_roster("import.csv", IMPORT_SIZE, 1000 + ROSTER_SIZE, header=True)
+    silence_dialogs(open_path="import.csv", save_path="export.csv")
+
+    start = time.perf_counter()
+    import Exercise3
+    root = tk.Tk()
+    app = Exercise3.StudentManagerApp(root)
+    wait_idle(root)
+    startup_ms = (time.perf_counter() - start) * 1000
+
+    # The table is streamed in with root.after, so wait for the last chunk
+    rec = Recorder(root, busy=lambda: app._render_job is not None)
+    for i in range(rounds):
+        rec.measure("view_all", find_button(root, "All Students").invoke)
+        rec.measure("sort_heading", lambda: app.sort_by_heading("Percentage"))
+        rec.measure("sort_second_heading", lambda: app.sort_by_heading("Name"))
+
+        def apply_filter():
+            app.predicates = [Exercise3.grade_in({"A", "B"}), Exercise3.exam_above(80)]
+            app.refresh()
+        rec.measure("filter", apply_filter)
+        rec.measure("top_performer", find_button(root, "Top Performer").invoke)
+        rec.measure("edit_exam", lambda: setattr(app.students[i], "exam", (app.students[i].exam + 1) % 101))
+        # Each edit starts the autosave debounce; write it now so the save is
+        # measured on its own instead of landing inside a later interaction
+        rec.measure("save_edit", app.autosave.flush)
+        rec.measure("export_grades", find_button(root, "Export Grades").invoke)
+
+    rec.measure("import_records", find_button(root, "Import Records").invoke)
+    rec.measure("close_flush", app.autosave.flush)
+
+    root.destroy()
+    return startup_ms, rec.summary()
+
+SCENARIOS = {
+    "quiz": (bench_quiz, 5),
+    "jokes": (bench_jokes, 50),
+    "students": (bench_students, 5),
+}
+
+def run_child(name):
+    """Runs one scenario in this process and prints the result as JSON."""
+    sys.path.insert(0, HERE)
+    func, rounds = SCENARIOS[name]
+    startup_ms, interactions = func(rounds)
+    import tkinter
+    print(json.dumps({
+        "app": name,
+        "python": sys.version.split()[0],
+        "tk": tkinter.TkVersion,
+        "startup_ms": round(startup_ms, 3),
+        "interactions": interactions,
+    }))
+
+# Parent side: starts Xvfb, runs each app, compares with the baselines
+
+def start_xvfb():
+    """Starts Xvfb on a free display and returns (process, display name)."""
+    if not shutil.which("Xvfb"):
+        sys.exit("Xvfb not found. Install it (e.g. apt install xvfb) or set DISPLAY.")
+    read_fd, write_fd = os.pipe()
+    proc = subprocess.Popen(["Xvfb", "-displayfd", str(write_fd), "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                            pass_fds=(write_fd,), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        number = f.readline().strip()
+    if not number:
+        proc.kill()
+        sys.exit("Xvfb failed to start.")
+    return proc, f":{number}"
+
+def run_scenario(name, display):
+    env = dict(os.environ, DISPLAY=display)
+    with tempfile.TemporaryDirectory() as workdir:
+        # Apps read and write their data files in the working directory
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", name],
+                             cwd=workdir, env=env, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(f"{name} benchmark failed:\n{out.stderr}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def compare(result, baseline):
+    """
+    Compares a run with its baseline.
+
+    :return: A list of human readable regression messages (empty if none).
+    """
+    problems = []
+    old_start, new_start = baseline["startup_ms"], result["startup_ms"]
+    if new_start > old_start * (1 + LATENCY_TOLERANCE) and new_start - old_start > LATENCY_FLOOR_MS:
+        problems.append(f"startup {old_start:.1f} -> {new_start:.1f} ms")
+
+    for name, new in result["interactions"].items():
+        old = baseline["interactions"].get(name)
+        if old is None:
+            continue
+        if new["median_ms"] > old["median_ms"] * (1 + LATENCY_TOLERANCE) and new["median_ms"] - old["median_ms"] > LATENCY_FLOOR_MS:
+            problems.append(f"{name}: median {old['median_ms']:.1f} -> {new['median_ms']:.1f} ms")
+        if "peak_growth_kb" in old:
+            old_kb, new_kb = old["peak_growth_kb"], new["peak_growth_kb"]
+            if new_kb > old_kb * (1 + RSS_TOLERANCE) and new_kb - old_kb > RSS_FLOOR_KB:
+                problems.append(f"{name}: peak RSS growth {old_kb} -> {new_kb} KB")
+    return problems
+
+def print_result(result):
+    print(f"\n{result['app']}  (startup {result['startup_ms']:.1f} ms)")
+    for name, stats in result["interactions"].items():
+        print(f"  {name:<20} median {stats['median_ms']:8.2f} ms  p95 {stats['p95_ms']:8.2f} ms  "
+              f"max {stats['max_ms']:8.2f} ms  peak RSS +{stats['peak_growth_kb']} KB")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GUI latency of the exercise apps.")
+    parser.add_argument("--only", choices=SCENARIOS, help="run a single app")
+    parser.add_argument("--update-baseline", action="store_true", help="save this run as the new baseline")
+    parser.add_argument("--child", choices=SCENARIOS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        return
+
+    xvfb = None
+    display = os.environ.get("DISPLAY")
+    if not display:
+        xvfb, display = start_xvfb()
+
+    regressions = []
+    missing = []
+    try:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        for name in [args.only] if args.only else SCENARIOS:
+            result = run_scenario(name, display)
+            print_result(result)
+
+            path = os.path.join(BASELINE_DIR, f"{name}.json")
+            if args.update_baseline:
+                with open(path, "w") as f:
+                    json.dump(result, f, indent=2)
+                print(f"  baseline written to {os.path.relpath(path, HERE)}")
+                continue
+            if not os.path.exists(path):
+                print(f"  NO BASELINE at {os.path.relpath(path, HERE)}")
+                missing.append(name)
+                continue
+
+            with open(path) as f:
+                problems = compare(result, json.load(f))
+            for problem in problems:
+                print(f"  REGRESSION {problem}")
+            regressions.extend(f"{name}: {p}" for p in problems)
+    finally:
+        if xvfb:
+            xvfb.terminate()
+            xvfb.wait()
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) found.")
+        sys.exit(1)
+    if missing:
+        print(f"\nNot checked, no baseline for: {', '.join(missing)}. Run with --update-baseline first.")
+        sys.exit(2)
+    if args.update_baseline:
+        print("\nBaselines updated.")
+    else:
+        print("\nNo regressions.")
+
+if __name__ == "__main__":
+    main()